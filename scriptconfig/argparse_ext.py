@@ -4,7 +4,7 @@ Argparse Extensions
 import argparse
 import os
 import sys
-_FALSY = {'0', 'false', 'f', 'no', ''}
+from scriptconfig.smartcast import _FALSY
 SCRIPTCONFIG_NORICH = os.environ.get('SCRIPTCONFIG_NORICH', '').lower() not in _FALSY
 
 
@@ -44,6 +44,21 @@ _Base = argparse._StoreAction
 # _Base = argparse.Action
 
 
+def _mark_explicitly_given(parser, dest):
+    """
+    Record that a destination was explicitly specified on the command line.
+
+    The scriptconfig parser is created with an ``_explicitly_given`` set, but
+    foreign parsers get one on demand.
+    """
+    explicitly_given = getattr(parser, '_explicitly_given', None)
+    if explicitly_given is None:
+        # We might be given a subparser / parent parser
+        # and not the original one we created.
+        explicitly_given = parser._explicitly_given = set()
+    explicitly_given.add(dest)
+
+
 class BooleanFlagOrKeyValAction(_Base):
     """
     An action that allows you to specify a boolean via a flag as per usual
@@ -132,11 +147,7 @@ class BooleanFlagOrKeyValAction(_Base):
         return ' | '.join(_option_strings)
 
     def _mark_parsed_argument(action, parser):
-        if not hasattr(parser, '_explicitly_given'):
-            # We might be given a subparser / parent parser
-            # and not the original one we created.
-            parser._explicitly_given = set()
-        parser._explicitly_given.add(action.dest)
+        _mark_explicitly_given(parser, action.dest)
 
     def __call__(action, parser, namespace, values, option_string=None):
         if option_string in action.option_strings:
@@ -226,6 +237,65 @@ class CounterOrKeyValAction(BooleanFlagOrKeyValAction):
         action._mark_parsed_argument(parser)
 
 
+class SmartCastAction(_Base):
+    """
+    The action used by scriptconfig for regular key/value and positional
+    arguments.
+
+    If a type isn't explicitly declared, values are cast with the template
+    registered for the destination in ``_scfg_default`` (if it exists) or with
+    a smartcast. Each config class binds its defaults to a subclass of this
+    once (see :func:`scriptconfig.value._maker_smart_parse_action`), so a new
+    action class does not need to be defined every time a parser is built.
+
+    Example:
+        >>> from scriptconfig.argparse_ext import *  # NOQA
+        >>> import argparse
+        >>> parser = argparse.ArgumentParser()
+        >>> parser.add_argument('--key', action=SmartCastAction)
+        >>> ns = parser.parse_args(['--key=1,2,3'])
+        >>> assert ns.key == [1, 2, 3]
+        >>> assert parser._explicitly_given == {'key'}
+        >>> # Comma lists given to a nargs action are flattened
+        >>> parser.add_argument('--items', action=SmartCastAction, nargs='+')
+        >>> ns = parser.parse_args(['--items', '1,2', '3,4'])
+        >>> assert ns.items == [1, 2, 3, 4]
+    """
+    _scfg_default = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # with script config nothing should be required by default
+        # (unless specified) all positional arguments should have
+        # keyword arg variants Setting required=False here will prevent
+        # positional args from erroring if they are not specified. I
+        # dont think there are other side effects, but we should make
+        # sure that is actually the case.
+        self.required = False  # hack
+
+        # Only actions that consume multiple strings can produce a list of
+        # lists, so the scalar case skips the flatten check entirely.
+        self._needs_flatten = self.nargs not in (None, argparse.OPTIONAL)
+
+        if self.type is None:
+            # If a type isn't explicitly declared, we will either use
+            # the template (if it exists) or try using a smartcast.
+            from scriptconfig.value import _template_cast_func
+            template = self._scfg_default.get(self.dest, None)
+            self.type = _template_cast_func(template)
+
+    def __call__(action, parser, namespace, values, option_string=None):
+        # An empty positional receives the raw default, which need not be a
+        # list, so the type still needs to be checked.
+        if (action._needs_flatten and isinstance(values, list) and values and
+                isinstance(values[0], list)):
+            # We got a list of lists, which we hack into a flat list
+            values = [v for sub in values for v in sub]
+
+        setattr(namespace, action.dest, values)
+        _mark_explicitly_given(parser, action.dest)
+
+
 class RawDescriptionDefaultsHelpFormatter(
         _RawDescriptionHelpFormatter,
         _ArgumentDefaultsHelpFormatter):
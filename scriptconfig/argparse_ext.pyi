@@ -42,6 +42,19 @@ class CounterOrKeyValAction(BooleanFlagOrKeyValAction):
         ...
 
 
+class SmartCastAction(_Base):
+
+    def __init__(self, *args, **kwargs) -> None:
+        ...
+
+    def __call__(action,
+                 parser,
+                 namespace,
+                 values,
+                 option_string: Incomplete | None = ...) -> None:
+        ...
+
+
 class RawDescriptionDefaultsHelpFormatter(_RawDescriptionHelpFormatter,
                                           _ArgumentDefaultsHelpFormatter):
     group_name_formatter = str
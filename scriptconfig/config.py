@@ -84,14 +84,18 @@ TODO:
     - [ ] Integrate with Hyrda
     - [x] Dataclass support - See DataConfig
 """
+import functools
+import os
+import threading
 import ubelt as ub
-import itertools as it
 from collections import OrderedDict
 from scriptconfig import _ubelt_repr_extension
 from scriptconfig import smartcast
 from scriptconfig.dict_like import DictLike
 from scriptconfig.file_like import FileLike
+from scriptconfig import value as value_mod
 from scriptconfig.value import Value
+from scriptconfig.value import scfg_isinstance
 # from scriptconfig.util.util_class import class_or_instancemethod
 
 __all__ = ['Config', 'define']
@@ -104,6 +108,23 @@ omegaconf: Any
 OmegaConf: object
 """
 
+# Help text for the special options added by Config.argparse
+_SPECIAL_CONFIG_HELP = ub.codeblock(
+    '''
+    special scriptconfig option that accepts the path to a on-disk
+    configuration file, and loads that into this {!r} object.
+    ''')
+_SPECIAL_DUMP_HELP = 'If specified, dump this config to disk.'
+_SPECIAL_DUMPS_HELP = 'If specified, dump this config stdout'
+
+# Titles of the groups argparse creates on its own, which are not ported
+_ARGPARSE_DEFAULT_GROUPS = frozenset({
+    'positional arguments', 'options', 'required'})
+
+# Code shared by the header of every ported config class
+_PORTED_IMPORT_LINES = ('import ubelt as ub', 'import scriptconfig as scfg', '')
+_PORTED_BASE_CLASS = {'orig': 'scfg.Config', 'dataconf': 'scfg.DataConfig'}
+
 
 # def _is_autoreload_enabled():
 #     """
@@ -120,23 +141,366 @@ OmegaConf: object
 #         return ipy.magics_manager.magics['line']['autoreload'].__self__._reloader.enabled
 
 
-def scfg_isinstance(item, cls):
+@functools.lru_cache(maxsize=128)
+def _shlex_split(text):
     """
-    use instead isinstance for scfg types when reloading
+    Cached :func:`shlex.split` for command line strings, which are often
+    parsed repeatedly (e.g. in tests).
 
     Args:
-        item (object): instance to check
-        cls (type): class to check against
+        text (str): the command line string
 
     Returns:
-        bool
+        Tuple[str, ...]: the arguments. A tuple is returned so the cached
+            result cannot be modified.
+
+    Example:
+        >>> _shlex_split('--src "a b" --dry')
+        ('--src', 'a b', '--dry')
+    """
+    import shlex
+    return tuple(shlex.split(text))
+
+
+def _copy_default(value):
+    """
+    Copy a default such that modifying the copy cannot modify the original.
+
+    Immutable values, and Values that wrap them, are shared instead of
+    copied. Values are never updated in place once they are stored in a
+    config, so this is safe.
+
+    Args:
+        value (Any | Value): the default
+
+    Returns:
+        Any | Value
+
+    Example:
+        >>> from scriptconfig.value import Value
+        >>> v1 = Value(3)
+        >>> assert _copy_default(v1) is v1
+        >>> v2 = Value([1, 2])
+        >>> assert _copy_default(v2).value is not v2.value
+        >>> assert _copy_default(v2).value == v2.value
+        >>> raw = {'a': []}
+        >>> assert _copy_default(raw)['a'] is not raw['a']
+    """
+    immutable_types = value_mod._IMMUTABLE_TYPES
+    if scfg_isinstance(value, Value):
+        if isinstance(value.value, immutable_types):
+            return value
+        return value.clone()
+    elif isinstance(value, immutable_types):
+        return value
+    else:
+        import copy
+        return copy.deepcopy(value)
+
+
+def _yaml_safe_loader():
+    """
+    The fastest available safe yaml loader.
+
+    Returns:
+        type: the libyaml backed ``CSafeLoader`` if PyYAML was built with it,
+            otherwise the pure-Python ``SafeLoader``.
+    """
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# The first non-space character of a json document that is also valid yaml.
+# Kept separate for str and bytes, which must not be compared (python -bb).
+_JSON_OPENERS = ('{', '[')
+_JSON_OPENERS_BYTES = (b'{', b'[')
+
+
+def _yaml_compatible_json_float(text):
+    """
+    Parse a json float literal, refusing the exponent forms that YAML 1.1
+    does not read as floats.
+    """
+    if 'e' in text or 'E' in text:
+        raise ValueError('yaml may not read {!r} as a float'.format(text))
+    return float(text)
+
+
+def _reject_json_constant(text):
+    """
+    Refuse NaN and Infinity, which YAML 1.1 reads as strings.
+    """
+    raise ValueError('yaml reads {!r} as a string'.format(text))
+
+
+def _load_yaml(text):
+    import yaml
+    return yaml.load(text, Loader=_yaml_safe_loader())
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_load_yaml(text):
+    """
+    Memoized :func:`_load_yaml` keyed by the file contents, so an edited file
+    is always parsed again. The result is shared and must not be modified.
+    """
+    return _load_yaml(text)
+
+
+def _parse_config_text(text, mode='yaml', cache=False):
+    """
+    Parse the text of a json or yaml config file.
+
+    Yaml text that looks like json is first given to the much faster stdlib
+    json parser. PyYAML implements YAML 1.1, which reads some json literals
+    differently (e.g. ``1e3`` and ``NaN`` are strings in yaml), so the json
+    result is only used if the text has none of those literals.
+
+    Args:
+        text (str | bytes): the contents of the config file
+        mode (str): can be 'yaml' or 'json'
+        cache (bool): if True, reuse the result of a previous yaml parse of
+            the same text. Json is cheaper to parse again than to copy, so
+            it is never cached.
+
+    Returns:
+        Any
+
+    Example:
+        >>> assert _parse_config_text('{"a": [1, 2]}') == {'a': [1, 2]}
+        >>> assert _parse_config_text('{a: [1, 2]}') == {'a': [1, 2]}
+        >>> assert _parse_config_text('a: 1', mode='yaml') == {'a': 1}
+        >>> assert _parse_config_text(b' [1, 2]') == [1, 2]
+        >>> assert _parse_config_text(b'a: 1') == {'a': 1}
+        >>> # Literals that yaml reads differently are left to yaml
+        >>> assert _parse_config_text('{"a": 1e3, "b": NaN}') == {'a': '1e3', 'b': 'NaN'}
+        >>> assert _parse_config_text('{"a": 1e3}', mode='json') == {'a': 1000.0}
+        >>> # Cached results are copied, so they can be modified
+        >>> data1 = _parse_config_text(b'a: [1, 2]', cache=True)
+        >>> data1['a'].append(3)
+        >>> assert _parse_config_text(b'a: [1, 2]', cache=True) == {'a': [1, 2]}
+    """
+    import json
+    if mode == 'json':
+        return json.loads(text)
+    openers = _JSON_OPENERS_BYTES if isinstance(text, bytes) else _JSON_OPENERS
+    if text[:64].lstrip()[:1] in openers:
+        try:
+            return json.loads(text, parse_float=_yaml_compatible_json_float,
+                              parse_constant=_reject_json_constant)
+        except ValueError:
+            # Flow style yaml that is not valid json, or json that yaml
+            # would read differently
+            pass
+    if cache:
+        import copy
+        return copy.deepcopy(_cached_load_yaml(text))
+    return _load_yaml(text)
+
+
+# Set SCRIPTCONFIG_DISABLE_CONFIG_CACHE=1 to always re-parse config files
+SCRIPTCONFIG_DISABLE_CONFIG_CACHE = os.environ.get(
+    'SCRIPTCONFIG_DISABLE_CONFIG_CACHE', '').lower() not in smartcast._FALSY
+
+
+def _parse_config_file(fpath, mode):
+    """
+    Parse the config file at ``fpath``, reusing the result of a previous yaml
+    parse if the file contents have not changed since.
+
+    Args:
+        fpath (str): path to a yaml or json file
+        mode (str): can be 'yaml' or 'json'
+
+    Returns:
+        Any: a new copy of the parsed data, which the caller may modify.
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('scriptconfig', 'tests', 'parse_cache').ensuredir()
+        >>> fpath = dpath / 'config.yaml'
+        >>> fpath.write_text('a: [1, 2]')
+        >>> data1 = _parse_config_file(str(fpath), 'yaml')
+        >>> data1['a'].append(3)
+        >>> data2 = _parse_config_file(str(fpath), 'yaml')
+        >>> assert data2 == {'a': [1, 2]}
+        >>> fpath.write_text('a: [1, 2, 3, 4]')
+        >>> data3 = _parse_config_file(str(fpath), 'yaml')
+        >>> assert data3 == {'a': [1, 2, 3, 4]}
+    """
+    # Both parsers decode bytes themselves, which skips the text layer
+    with open(fpath, 'rb') as file:
+        text = file.read()
+    return _parse_config_text(
+        text, mode, cache=not SCRIPTCONFIG_DISABLE_CONFIG_CACHE)
+
+
+def _read_user_config(data, mode=None):
+    """
+    Resolve the data given to :func:`Config.load` into a dictionary.
+
+    Args:
+        data (PathLike | dict | Config | None):
+            a path to a yaml / json file, an open file, a dictionary, or
+            another config.
+
+        mode (str | None):
+            can be 'yaml' or 'json'. Inferred from the file extension if
+            unspecified.
+
+    Returns:
+        dict
     """
-    # Note: it is safe to simply use isinstance(item, cls) when
-    # not reloading
-    if hasattr(item, '__scfg_class__')  and hasattr(cls, '__scfg_class__'):
-        return item.__scfg_class__ == cls.__scfg_class__
+    # Check the common in-memory inputs before the file inputs
+    if data is None:
+        return {}
+    elif isinstance(data, dict):
+        return data
+    if isinstance(data, os.PathLike):
+        data = os.fspath(data)
+    if isinstance(data, str) or hasattr(data, 'readable'):
+        if mode is None:
+            # Only the extension needs to be lowercased, not the whole path
+            if (isinstance(data, str) and
+                    os.path.splitext(data)[1].lower() == '.json'):
+                mode = 'json'
+            else:
+                # Default to yaml (which includes .yml and .yaml)
+                mode = 'yaml'
+        if isinstance(data, str) and os.path.isfile(data):
+            user_config = _parse_config_file(data, mode)
+        else:
+            with FileLike(data, 'r') as file:
+                text = file.read()
+            user_config = _parse_config_text(text, mode)
+        user_config.pop('__heredoc__', None)  # ignore special heredoc key
+        return user_config
+    elif scfg_isinstance(data, Config):
+        return data.asdict()
     else:
-        return isinstance(item, cls)
+        raise TypeError(
+            'Expected path or dict, but got {}'.format(type(data)))
+
+
+def _yaml_represent_ordered_dict(dumper, data):
+    return dumper.represent_mapping('tag:yaml.org,2002:map', data.items(),
+                                    flow_style=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_dumper():
+    """
+    The fastest available safe yaml dumper, extended to write OrderedDicts as
+    regular mappings. This is created once on first use.
+
+    Returns:
+        type: a subclass of the libyaml backed ``CSafeDumper`` if PyYAML was
+            built with it, otherwise of the pure-Python ``SafeDumper``.
+
+    Example:
+        >>> import yaml
+        >>> data = {'a': OrderedDict([('z', 1), ('y', 2)])}
+        >>> print(yaml.dump(data, Dumper=_yaml_safe_dumper()), end='')
+        a:
+          z: 1
+          y: 2
+    """
+    import yaml
+    base = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    class _ConfigSafeDumper(base):
+        pass
+    _ConfigSafeDumper.add_representer(OrderedDict, _yaml_represent_ordered_dict)
+    return _ConfigSafeDumper
+
+
+# Guards the creation of the per-class parser locks
+_PARSER_LOCK_INIT = threading.Lock()
+
+
+def _class_parser_lock(cls):
+    """
+    The lock that serializes use of the parser cached on ``cls`` by
+    :func:`Config._cached_argparse`.
+
+    Args:
+        cls (type): a Config subclass
+
+    Returns:
+        threading.RLock
+    """
+    lock = cls.__dict__.get('_scfg_parser_lock', None)
+    if lock is None:
+        with _PARSER_LOCK_INIT:
+            lock = cls.__dict__.get('_scfg_parser_lock', None)
+            if lock is None:
+                lock = threading.RLock()
+                cls._scfg_parser_lock = lock
+    return lock
+
+
+def _class_codeblock(cls, attr, text):
+    """
+    Dedent ``text`` with :func:`ubelt.codeblock`, memoizing the result on
+    ``cls`` under ``attr``.
+
+    The cache remembers the text it was computed from, so it is only reused
+    while the class-level text is unchanged.
+
+    Args:
+        cls (type): the class that owns the text
+        attr (str): name of the class attribute used as the cache
+        text (str): the text to dedent
+
+    Returns:
+        str
+
+    Example:
+        >>> class Demo:
+        >>>     pass
+        >>> text = '''
+        >>>     hello
+        >>>     '''
+        >>> assert _class_codeblock(Demo, '_demo_cache', text) == 'hello'
+        >>> assert Demo._demo_cache == (text, 'hello')
+        >>> assert _class_codeblock(Demo, '_demo_cache', 'world') == 'world'
+    """
+    cached = cls.__dict__.get(attr, None)
+    if cached is not None and cached[0] == text:
+        return cached[1]
+    block = ub.codeblock(text)
+    setattr(cls, attr, (text, block))
+    return block
+
+
+def _has_default_setitem(cls):
+    """
+    Check if ``cls`` keeps the default item assignment, in which case values
+    can be written into ``_data`` directly instead of through ``setitem``.
+
+    Args:
+        cls (type): a Config subclass
+
+    Returns:
+        bool
+    """
+    return (cls.setitem is Config.setitem and
+            cls.__setitem__ is DictLike.__setitem__)
+
+
+def _has_default_getitem(cls):
+    """
+    Check if ``cls`` keeps the default item lookup, in which case values can
+    be read from ``_data`` directly instead of through ``getitem``.
+
+    Args:
+        cls (type): a Config subclass
+
+    Returns:
+        bool
+    """
+    return (cls.getitem is Config.getitem and
+            cls.__getitem__ is DictLike.__getitem__)
 
 
 def define(default={}, name=None):
@@ -339,12 +703,13 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         """
         # The _data attribute holds
         self._data = None
-        self._default = OrderedDict()
+        self._default = {}
         cls_default = getattr(self, '__default__', getattr(self, 'default', None))
         if cls_default:
             # allow for class attributes to specify the default
             self._default.update(cls_default)
         self._alias_map = None
+        self._required_defaults = None
         self.load(data, cmdline=cmdline, default=default,
                   _dont_call_post_init=_dont_call_post_init)
 
@@ -498,20 +863,35 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
 
         Example:
             >>> self = Config.demo()
-            >>> self.__json__()
+            >>> assert self.__json__()['option2'] == [1, 2, 3]
+            >>> self['option2'] = [1, 2, 3]
+            >>> assert self.__json__() == self.asdict()
             >>> self['option1'] = {1, 2, 3}
             >>> self['option2'] = {(1, 2): 'fds'}
             >>> self.__json__()
         """
-        try:
-            import numpy
-        except ImportError:
-            numpy = None
         data = self.asdict()
 
         BUILTIN_SCALAR_TYPES = (str, int, float, complex)
         BUILTIN_VECTOR_TYPES = (set, frozenset, list, tuple)
 
+        def _is_json_leaf(item):
+            return item is None or isinstance(item, BUILTIN_SCALAR_TYPES)
+
+        # Fast path: most configs only contain scalars and lists of scalars,
+        # which are already serializable and do not need to be walked.
+        for value in data.values():
+            if not _is_json_leaf(value) and not (
+                    isinstance(value, list) and all(map(_is_json_leaf, value))):
+                break
+        else:
+            return data
+
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
         # The walker method should be more efficient.
         walker = ub.IndexableWalker(data, list_cls=BUILTIN_VECTOR_TYPES)
         for path, item in walker:
@@ -526,7 +906,7 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             elif isinstance(item, OrderedDict):
                 ...
             elif isinstance(item, dict):
-                walker[path] = OrderedDict(sorted(item.items()))
+                walker[path] = dict(sorted(item.items()))
             else:
                 if hasattr(item, '__json__'):
                     return item.__json__()
@@ -547,6 +927,19 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
 
         Returns:
             Any : the associated value
+
+        Example:
+            >>> import scriptconfig as scfg
+            >>> class MyConfig(scfg.Config):
+            >>>     __default__ = {'a': 1, 'b': scfg.Value(2)}
+            >>> self = MyConfig()
+            >>> assert self.getitem('a') == 1
+            >>> # Values from a reloaded module are still unwrapped
+            >>> class ReloadedValue:
+            >>>     __scfg_class__ = 'Value'
+            >>>     value = 3
+            >>> self._data['b'] = ReloadedValue()
+            >>> assert self.getitem('b') == 3
         """
         try:
             value = self._data[key]
@@ -555,7 +948,10 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             key = self._normalize_alias_key(key)
             value = self._data[key]
 
-        if scfg_isinstance(value, Value):
+        # This is scfg_isinstance(value, Value) inlined, because it runs on
+        # every access and the stored value is usually not a Value.
+        if isinstance(value, Value) or (
+                getattr(value, '__scfg_class__', None) == Value.__scfg_class__):
             value = value.value
         return value
 
@@ -579,16 +975,60 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             # If the new item is a Value object simply overwrite the old one
             self._data[key] = value
         else:
-            template = self.__default__.get(key, None)
-            if template is not None and scfg_isinstance(template, Value):
+            cast = self._default_casters().get(key, None)
+            if cast is not None:
                 # If the new value is raw data, and we have a underlying Value
                 # object update it.
-                self._data[key] = template.cast(value)
+                self._data[key] = cast(value)
             else:
                 # If we don't have an underlying Value object simply set the
                 # raw data.
                 self._data[key] = value
 
+    def _bulk_update(self, other):
+        """
+        Like :func:`update`, but ``other`` must only contain keys that are
+        already in the config (aliases resolved). This skips the per-key
+        alias and new-attribute checks of :func:`setitem`.
+
+        Args:
+            other (dict): new values for existing keys
+
+        Example:
+            >>> import scriptconfig as scfg
+            >>> class MyConfig(scfg.Config):
+            >>>     __default__ = {'a': scfg.Value(1, type=int), 'b': None}
+            >>> self = MyConfig()
+            >>> self._bulk_update({'a': '2', 'b': '3'})
+            >>> assert self.to_dict() == {'a': 2, 'b': '3'}
+        """
+        _data = self._data
+        _casters = self._default_casters()
+        for key, value in other.items():
+            if not scfg_isinstance(value, Value):
+                cast = _casters.get(key, None)
+                if cast is not None:
+                    value = cast(value)
+            _data[key] = value
+
+    def _default_casters(self):
+        """
+        Map each key with a Value in the class defaults to its cast method.
+
+        This only depends on the class defaults, so it is cached on the class.
+
+        Returns:
+            Dict[str, Callable[[Any], Any]]
+        """
+        default = self.__default__
+        cache = self.__class__.__dict__.get('_scfg_default_casters_cache', None)
+        if cache is None or cache[0] is not default:
+            casters = {k: v.cast for k, v in default.items()
+                       if scfg_isinstance(v, Value)}
+            cache = (default, casters)
+            self.__class__._scfg_default_casters_cache = cache
+        return cache[1]
+
     def delitem(self, key):
         raise Exception('cannot delete items from a config')
 
@@ -623,6 +1063,7 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
 
         self._default.update(default)
         self._alias_map = None
+        self._required_defaults = None
 
     def load(self, data=None, cmdline=False, mode=None, default=None,
              strict=False, autocomplete=False, _dont_call_post_init=False,
@@ -748,39 +1189,19 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         if default:
             self.update_defaults(default)
 
-        # Maybe this shouldn't be a deep copy?
-        import copy
-        _default = copy.deepcopy(self._default)
-
-        if mode is None:
-            if isinstance(data, str):
-                if data.lower().endswith('.json'):
-                    mode = 'json'
-        if mode is None:
-            # Default to yaml
-            mode = 'yaml'
+        # Copy the defaults so loaded values cannot modify them. Only the
+        # values need to be independent, so avoid a full deepcopy.
+        _default = self._default
+        _data = {k: _copy_default(v) for k, v in _default.items()}
 
-        if data is None:
-            user_config = {}
-        elif isinstance(data, str) or hasattr(data, 'readable'):
-            import yaml
-            with FileLike(data, 'r') as file:
-                user_config = yaml.load(file, Loader=yaml.SafeLoader)
-            user_config.pop('__heredoc__', None)  # ignore special heredoc key
-        elif isinstance(data, dict):
-            user_config = data
-        elif scfg_isinstance(data, Config):
-            user_config = data.asdict()
-        else:
-            raise TypeError(
-                'Expected path or dict, but got {}'.format(type(data)))
+        user_config = _read_user_config(data, mode)
 
         # check for unknown values
-        indirect_keys = set(user_config) - set(_default)
+        indirect_keys = [k for k in user_config if k not in _default]
         if indirect_keys:
             # Check if unknown keys are aliases
             unknown_keys = []
-            _alias_map = self._build_alias_map()
+            _alias_map = self._get_alias_map()
             for a in indirect_keys:
                 if a in _alias_map:
                     k = _alias_map[a]
@@ -790,16 +1211,23 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             if unknown_keys:
                 raise KeyError('Unknown data options {}'.format(unknown_keys))
 
-        self._data = _default.copy()
-        self.update(user_config)
+        self._data = _data
+        if user_config:
+            if _has_default_setitem(self.__class__):
+                self._bulk_update(user_config)
+            else:
+                # Respect subclasses that customize item assignment
+                self.update(user_config)
 
         if isinstance(cmdline, str):
             # allow specification using the actual command line arg string
-            import shlex
-            import os
-            cmdline = shlex.split(os.path.expandvars(cmdline))
+            # Variables are expanded before the cache lookup because the
+            # environment can change between calls.
+            cmdline = list(_shlex_split(os.path.expandvars(cmdline)))
 
-        if cmdline or ub.iterable(cmdline):
+        # An empty argv list still means "parse this argv instead of sys.argv"
+        argv_given = ub.iterable(cmdline)
+        if cmdline or argv_given:
             # TODO: if user_config is specified, then we should probably not
             # override any values in user_config with the defaults? The CLI
             # should override them IF they exist on in sys.argv, but not if
@@ -815,7 +1243,7 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                                         migration='The API should expose any special params explicitly',
                                         deprecate='0.7.15', error='0.10.0', remove='1.0.0')
                 read_argv_kwargs.update(cmdline)
-            elif ub.iterable(cmdline) or isinstance(cmdline, str):
+            elif argv_given:
                 read_argv_kwargs['argv'] = cmdline
             self._read_argv(**read_argv_kwargs)
 
@@ -823,21 +1251,45 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             if 1:
                 # Check that all required variables are not the same as defaults
                 # Probably a way to make this check nicer
-                for k, v in self._default.items():
-                    if scfg_isinstance(v, Value):
-                        if v.required:
-                            if self[k] == v.value:
-                                raise Exception('Required variable {!r} still has default value'.format(k))
+                for k, v in self._get_required_defaults():
+                    if self[k] == v.value:
+                        raise Exception('Required variable {!r} still has default value'.format(k))
             self.__post_init__()
         return self
 
+    def _get_alias_map(self):
+        """
+        The memoized mapping from aliases to primary keys. This is reset by
+        :func:`Config.update_defaults`.
+
+        Returns:
+            Dict[str, str]
+        """
+        _alias_map = getattr(self, '_alias_map', None)
+        if _alias_map is None:
+            _alias_map = self._alias_map = self._build_alias_map()
+        return _alias_map
+
+    def _get_required_defaults(self):
+        """
+        The memoized default Values that are marked as required. This is reset
+        by :func:`Config.update_defaults`.
+
+        Returns:
+            List[Tuple[str, Value]]
+        """
+        required = getattr(self, '_required_defaults', None)
+        if required is None:
+            required = self._required_defaults = [
+                (k, v) for k, v in self._default.items()
+                if scfg_isinstance(v, Value) and v.required]
+        return required
+
     def _normalize_alias_key(self, key):
         """
         normalizes a single aliased key
         """
-        if getattr(self, '_alias_map', None) is None:
-            self._alias_map = self._build_alias_map()
-        return self._alias_map.get(key, key)
+        return self._get_alias_map().get(key, key)
 
     def _normalize_alias_dict(self, data):
         """
@@ -847,9 +1299,10 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         Returns:
             dict: keys are normalized to be primary keys.
         """
-        if getattr(self, '_alias_map', None) is None:
-            self._alias_map = self._build_alias_map()
-        norm = {self._alias_map.get(k, k): v for k, v in data.items()}
+        _alias_map = self._get_alias_map()
+        if not _alias_map:
+            return dict(data)
+        norm = {_alias_map.get(k, k): v for k, v in data.items()}
         return norm
 
     def _build_alias_map(self):
@@ -957,46 +1410,51 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             >>> print('self = {}'.format(self))
         """
         if isinstance(argv, str):
-            import shlex
-            argv = shlex.split(argv)
+            argv = list(_shlex_split(argv))
 
         # TODO: warn about any unused flags
-        parser = self.argparse(special_options=special_options)
+        # The cached parser is shared by every instance of the class and
+        # its defaults are rebound to this instance, so building and
+        # parsing must not interleave with other threads.
+        with _class_parser_lock(self.__class__):
+            parser = self._cached_argparse(special_options=special_options)
+
+            if autocomplete:
+                try:
+                    import argcomplete as argcomplete_mod
+                except ImportError:
+                    if autocomplete != 'auto':
+                        raise
+                else:
+                    argcomplete_mod.autocomplete(parser)
 
-        if autocomplete:
             try:
-                import argcomplete as argcomplete_mod
-            except ImportError:
-                if autocomplete != 'auto':
-                    raise
-            else:
-                argcomplete_mod.autocomplete(parser)
-
-        try:
-            if strict:
-                ns = parser.parse_args(argv).__dict__
-            else:
-                ns = parser.parse_known_args(argv)[0].__dict__
-        except (ValueError, TypeError) as ex:
-            # For errors (like ValueError) where its probably a programmer
-            # error and not a user error, give the debugger some information
-            # about the scriptconfig object.
-            from scriptconfig.util import util_exception
-            # TODO: figure out argv that triggers a value error so we can add a test
-            note = ub.codeblock(
-                f'''
-                Error while attempting to parse arguments in _read_argv
-
-                Context:
-                    argv = {argv!r}
-                    special_options = {special_options!r}
-                    strict = {strict!r}
-                    autocomplete = {autocomplete!r}
-                    self = {self!r}
-                ''')
-            print(note)
-            ex = util_exception.add_exception_note(ex, note)
-            raise ex
+                if strict:
+                    ns = parser.parse_args(argv).__dict__
+                else:
+                    ns = parser.parse_known_args(argv)[0].__dict__
+            except (ValueError, TypeError) as ex:
+                # For errors (like ValueError) where its probably a programmer
+                # error and not a user error, give the debugger some information
+                # about the scriptconfig object.
+                from scriptconfig.util import util_exception
+                # TODO: figure out argv that triggers a value error so we can add a test
+                note = ub.codeblock(
+                    f'''
+                    Error while attempting to parse arguments in _read_argv
+
+                    Context:
+                        argv = {argv!r}
+                        special_options = {special_options!r}
+                        strict = {strict!r}
+                        autocomplete = {autocomplete!r}
+                        self = {self!r}
+                    ''')
+                print(note)
+                ex = util_exception.add_exception_note(ex, note)
+                raise ex
+            # Keep a reference, the next parse replaces the parser's set
+            _explicitly_given = parser._explicitly_given
 
         special_ns_keys = ['config', 'dump', 'dumps']
         if special_options:
@@ -1008,12 +1466,18 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         # stable.
         RELY_ON_ACTION_SMARTCAST = True
 
+        # Every parsed key is a known key with a raw value, so we can bypass
+        # the alias resolution and Value checks in setitem, unless a subclass
+        # customizes item assignment.
+        _data = self._data
+        _casters = self._default_casters()
+        _direct = _has_default_setitem(self.__class__)
+
         # First load argparse defaults in first
-        _not_given = set(ns.keys()) - parser._explicitly_given
-        # print('_not_given = {!r}'.format(_not_given))
-        # print('parser._explicitly_given = {!r}'.format(parser._explicitly_given))
-        for key in _not_given:
-            value = ns[key]
+        # print('_explicitly_given = {!r}'.format(_explicitly_given))
+        for key, value in ns.items():
+            if key in _explicitly_given:
+                continue
             # NOTE: this implementation is messy and needs refactor.
             # Currently the .__default__ .default, ._default, and ._data
             # attributes can all be Value objects, but this gets messy when the
@@ -1036,7 +1500,11 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                     value = template.cast(value)
 
             # if value is not None:
-            self[key] = value
+            if _direct:
+                cast = _casters.get(key, None)
+                _data[key] = value if cast is None else cast(value)
+            else:
+                self[key] = value
 
         # Then load config file defaults
         if special_options:
@@ -1046,7 +1514,9 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                           _dont_call_post_init=True)
 
         # Finally load explicit CLI values
-        for key in parser._explicitly_given:
+        # (loading a config file replaces the data dictionary)
+        _data = self._data
+        for key in _explicitly_given:
             if key not in special_ns:
                 value = ns[key]
 
@@ -1063,7 +1533,11 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                         value = smartcast.smartcast(value)
 
                 # if value is not None:
-                self[key] = value
+                if _direct:
+                    cast = _casters.get(key, None)
+                    _data[key] = value if cast is None else cast(value)
+                else:
+                    self[key] = value
 
         # We dont want this here right?
         # self.__post_init__()
@@ -1109,17 +1583,32 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             mode = 'yaml'
         if mode == 'yaml':
             import yaml
-            def order_rep(dumper, data):
-                return dumper.represent_mapping('tag:yaml.org,2002:map', data.items(), flow_style=False)
-            yaml.add_representer(OrderedDict, order_rep)
-            return yaml.safe_dump(dict(self.items()), stream)
+            return yaml.dump(self._unwrapped_data(), stream,
+                             Dumper=_yaml_safe_dumper())
         elif mode == 'json':
             import json
-            json_text = json.dumps(OrderedDict(self.items()), indent=4)
-            return json_text
+            text = json.dumps(self._unwrapped_data(), indent=4)
+            if stream is None:
+                return text
+            # A single write is cheaper than the chunked writes of json.dump
+            stream.write(text)
         else:
             raise KeyError(mode)
 
+    def _unwrapped_data(self):
+        """
+        The current values in a new dictionary, built directly from the
+        underlying data instead of going through ``getitem`` for each key,
+        unless a subclass customizes item lookup.
+
+        Returns:
+            dict
+        """
+        if not _has_default_getitem(self.__class__):
+            return dict(self.items())
+        return {k: v.value if scfg_isinstance(v, Value) else v
+                for k, v in self._data.items()}
+
     def dumps(self, mode=None):
         """
         Write the configuration to a text object and return it
@@ -1156,7 +1645,8 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             import scriptconfig
             description = f'argparse CLI generated by scriptconfig {scriptconfig.__version__}'
         if description is not None:
-            description = ub.codeblock(description)
+            description = _class_codeblock(
+                self.__class__, '_scfg_description_cache', description)
         return description
 
     @property
@@ -1169,7 +1659,8 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
 
         epilog = getattr(self, '__epilog__', getattr(self, 'epilog', None))
         if epilog is not None:
-            epilog = ub.codeblock(epilog)
+            epilog = _class_codeblock(
+                self.__class__, '_scfg_epilog_cache', epilog)
         return epilog
 
     @property
@@ -1238,44 +1729,32 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         else:
             indent = ' ' * 8
 
-        if style == 'orig':
-            recon_str = [
-                'import ubelt as ub',
-                'import scriptconfig as scfg',
-                '',
-                'class ' + name + '(scfg.Config):',
-                '    """',
-                ub.indent(description or ''),
-                '    """',
-                '    __default__ = {',
-            ]
-        elif style == 'dataconf':
-            recon_str = [
-                'import ubelt as ub',
-                'import scriptconfig as scfg',
-                '',
-                'class ' + name + '(scfg.DataConfig):',
-                '    """',
-                ub.indent(description or ''),
-                '    """',
-            ]
-        else:
+        if style not in _PORTED_BASE_CLASS:
             raise KeyError(style)
+        recon_str = list(_PORTED_IMPORT_LINES)
+        recon_str += [
+            f'class {name}({_PORTED_BASE_CLASS[style]}):',
+            '    """',
+            ub.indent(description or ''),
+            '    """',
+        ]
+        if style == 'orig':
+            recon_str.append('    __default__ = {')
 
         for (key, value_kw) in entries:
-            _value_kw = value_kw.copy()
-
-            default = _value_kw.pop('default')
+            default = value_kw['default']
             value_args = [
                 repr(default),
             ]
-            value_args.extend(['{}={}'.format(k, repr(v)) for k, v in _value_kw.items() if v is not None])
+            value_args.extend(f'{k}={v!r}' for k, v in value_kw.items()
+                              if k != 'default' and v is not None)
             val_body = ', '.join(value_args)
+            fixme = value_mod._fixme_comment(value_kw.values())
 
             if style == 'orig':
-                recon_str.append("{}'{}': scfg.Value({}),".format(indent, key, val_body))
+                recon_str.append(f"{indent}'{key}': scfg.Value({val_body}),{fixme}")
             elif style ==  'dataconf':
-                recon_str.append("{}{} = scfg.Value({})".format(indent, key, val_body))
+                recon_str.append(f"{indent}{key} = scfg.Value({val_body}){fixme}")
             else:
                 raise KeyError(style)
 
@@ -1419,41 +1898,33 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
             >>> recon = self.argparse()
             >>> print('recon._actions = {}'.format(ub.urepr(recon._actions, nl=1)))
         """
+        import itertools as it
         # This logic should be able to be used statically or dynamically
         # to transition argparse to ScriptConfig code.
         pos_counter = it.count(1)
 
         # Determine if the parser has groups / mutex groups. Build mappings so
         # we can lookup which action is associated with which group later.
+        # Each group is visited once, so anonymous groups can be numbered as
+        # they are found. The actions themselves are used as lookup keys.
         group_counter = it.count(1)
         mgroup_counter = it.count(1)
-        annon_groupid_to_key = {}
-        annon_mgroupid_to_key = {}
-        default_groups = {'positional arguments', 'options', 'required'}
-        actionid_to_groupkey = {}
-        actionid_to_mgroupkey = {}
+        action_to_groupkey = {}
+        action_to_mgroupkey = {}
         # Build group lookups table
         for group in parser._action_groups:
-            if group.title not in default_groups:
+            if group.title not in _ARGPARSE_DEFAULT_GROUPS:
                 if group.title is not None:
                     group_key = group.title
                 else:
-                    group_id = id(group)
-                    if group_id not in annon_groupid_to_key:
-                        annon_groupid_to_key[group_id] = next(group_counter)
-                    group_key = annon_groupid_to_key[group_id]
+                    group_key = next(group_counter)
                 for action in group._group_actions:
-                    action_id = id(action)
-                    actionid_to_groupkey[action_id] = group_key
+                    action_to_groupkey[action] = group_key
         # Build mutex group lookups table
         for mutex_group in parser._mutually_exclusive_groups:
-            mgroup_id = id(mutex_group)
-            if mgroup_id not in annon_mgroupid_to_key:
-                annon_mgroupid_to_key[mgroup_id] = next(mgroup_counter)
-            mgroup_key = annon_mgroupid_to_key[mgroup_id]
+            mgroup_key = next(mgroup_counter)
             for action in mutex_group._group_actions:
-                action_id = id(action)
-                actionid_to_mgroupkey[action_id] = mgroup_key
+                action_to_mgroupkey[action] = mgroup_key
 
         # Iterate over all of the actions and build the appropriate value to be
         # placed in the scriptconfig class.
@@ -1464,7 +1935,7 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                 # scriptconfig takes care of help for us
                 continue
             value = Value._from_action(
-                action, actionid_to_groupkey, actionid_to_mgroupkey, pos_counter)
+                action, action_to_groupkey, action_to_mgroupkey, pos_counter)
             value_kw = value._to_value_kw()
             entries.append((key, value_kw))
 
@@ -1532,7 +2003,6 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                 constructor_body=constructor_body,
             ))
 
-        from scriptconfig import value as value_mod
         for key, _value in self._data.items():
             if isinstance(_value, value_mod.Value):
                 value = _value.value
@@ -1549,14 +2019,15 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
                 if not isinstance(kwargs.get('action'), str):
                     kwargs.pop('action')
                 if kwargs.get('type', None) is not None:
-                    kwargs['type'] = value_mod.CodeRepr(kwargs['type'].__name__)
+                    kwargs['type'] = value_mod._type_coderepr(kwargs['type'])
                 to_pop = {k for k, v in kwargs.items() if v is None}
                 kwargs = ub.udict(kwargs) - to_pop
                 args_body = ub.urepr(args, explicit=1, nobr=1, trailsep=0).strip().strip(',')
                 kwargs_body = ub.urepr(kwargs, explicit=1, nobr=1, trailsep=0, nl=0).strip(',')
                 if args_body and kwargs_body:
                     args_body += ', '
-                lines.append(f'parser.{meth}({args_body}{kwargs_body})')
+                fixme = value_mod._fixme_comment(kwargs.values())
+                lines.append(f'parser.{meth}({args_body}{kwargs_body}){fixme}')
 
         text = '\n'.join(lines)
         return text
@@ -1593,6 +2064,131 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         oconf = OmegaConf.create(self.to_dict())
         return oconf
 
+    def _argparse_plan(self):
+        """
+        Resolve the Value metadata used to add each key as an argument.
+
+        Returns:
+            List[Tuple[str, Any, Value]]:
+                the key, its current unwrapped value, and the Value metadata
+                describing how it is exposed on the command line. The
+                metadata may be shared with the defaults, so its ``value``
+                should not be used.
+        """
+        # IRC: this ensures each key has a real Value class
+        # This is messy and needs to be rethought
+        _default = self._default
+        plan = []
+        for key, value in self._data.items():
+            template = _default.get(key, None)
+            if isinstance(value, Value):
+                if key not in _default:
+                    raise AssertionError('Did not expect {value=} to be a Value')
+                # Use the metadata in the Value class to enhance argparse
+                _value = value
+                value = _value.value
+            elif isinstance(template, Value):
+                # If the _data did not have value information but the _default
+                # does, use that. The metadata is shared with the default,
+                # only the current value differs.
+                _value = template
+                value = template.cast(value)
+            else:
+                # In this case the user did not wrap the default with a
+                # Value, so we can only infer so much about it, but we can
+                # make some educated guesses.
+                _autokw = {
+                    'help': '',
+                }
+                if isinstance(value, bool) or isinstance(value, int) and value in {0, 1}:
+                    # In this case they probably wanted a boolean flag
+                    # In any case it restrict functionality to set isflag=1
+                    _autokw['isflag'] = True
+                _value = Value(value, **_autokw)
+            plan.append((key, value, _value))
+
+        _positions = [_value.position for key, value, _value in plan
+                      if _value.position is not None]
+        if len(set(_positions)) != len(_positions):
+            # TODO: make this a warning in 3.7+ and ensure there is a good
+            # API for just indicating that a value is supposed to be
+            # positional, and using its order in the dictionary as that
+            # position. Need to account for inheritance though.
+            raise Exception('two values have the same position')
+        return plan
+
+    def _cached_argparse(self, special_options=False):
+        """
+        Like :func:`Config.argparse`, but reuses the parser built for a
+        previous instance of this class when it would be identical.
+
+        Only the argument defaults depend on the instance values, so a cached
+        parser is reused whenever everything else about the arguments is
+        unchanged, and the defaults are rebound to the current values. The
+        returned parser is owned by the class and should not be modified.
+        Rebinding and parsing must happen while holding the lock returned by
+        ``_class_parser_lock`` so concurrent instances do not see each
+        other's defaults.
+
+        Args:
+            special_options (bool, default=False):
+                adds special scriptconfig options, namely: --config, --dumps,
+                and --dump.
+
+        Returns:
+            argparse.ArgumentParser
+
+        Example:
+            >>> import scriptconfig as scfg
+            >>> class MyConfig(scfg.DataConfig):
+            >>>     num = 10
+            >>>     flag = scfg.Value(False, isflag=True)
+            >>> parser1 = MyConfig()._cached_argparse()
+            >>> parser2 = MyConfig(num=20)._cached_argparse()
+            >>> assert parser1 is parser2
+            >>> assert parser2.parse_args([]).num == 20
+            >>> # Different special options require a different parser
+            >>> parser3 = MyConfig()._cached_argparse(special_options=True)
+            >>> assert parser3 is not parser1
+            >>> assert parser3.parse_args([]).num == 10
+            >>> # Unwrapped values of 0 or 1 are inferred as flags, which
+            >>> # changes the parser
+            >>> parser4 = MyConfig(num=1)._cached_argparse(special_options=True)
+            >>> assert parser4 is not parser3
+        """
+        cls = self.__class__
+        if cls.argparse is not Config.argparse:
+            # Subclasses that customize the parser are not cached
+            return self.argparse(special_options=special_options)
+
+        plan = self._argparse_plan()
+        signature = (
+            special_options,
+            getattr(self, '__fuzzy_hyphens__', 1),
+            self._parserkw(),
+            [(key, _value.__class__, value is None,
+              {k: v for k, v in _value.__dict__.items() if k != 'value'})
+             for key, value, _value in plan],
+        )
+        cache = cls.__dict__.get('_scfg_parser_cache', None)
+        try:
+            is_hit = cache is not None and cache[0] == signature
+        except Exception:
+            # Metadata that cannot be compared is never cached
+            is_hit = False
+
+        if is_hit:
+            parser = cache[1]
+            defaults = {key: value for key, value, _value in plan}
+            for action in parser._actions:
+                if action.dest in defaults:
+                    action.default = defaults[action.dest]
+            parser._explicitly_given = set()
+        else:
+            parser = self.argparse(special_options=special_options)
+            cls._scfg_parser_cache = (signature, parser)
+        return parser
+
     def argparse(self, parser=None, special_options=False):
         """
         construct or update an argparse.ArgumentParser CLI parser
@@ -1761,81 +2357,23 @@ class Config(ub.NiceRepr, DictLike, metaclass=MetaConfig):
         # the commandline
         parser._explicitly_given = set()
 
-        # IRC: this ensures each key has a real Value class
-        # This is messy and needs to be rethought
-        _metadata = {
-            key: self._data[key]
-            for key, value in self._default.items()
-            if isinstance(self._data[key], Value)
-        }  # :type: Dict[str, Value]
-        for k, v in self._default.items():
-            # If the _data did not have value information but the _default
-            # does, use that. This is very ugly.
-            if k not in _metadata:
-                if isinstance(v, Value):
-                    _metadata[k] = v.copy().update(self._data[k])
-        _positions = {k: v.position for k, v in _metadata.items()
-                      if v.position is not None}
-        if _positions:
-            if ub.find_duplicates(_positions.values()):
-                # TODO: make this a warning in 3.7+ and ensure there is a good
-                # API for just indicating that a value is supposed to be
-                # positional, and using its order in the dictionary as that
-                # position. Need to account for inheritance though.
-                raise Exception('two values have the same position')
-            _keyorder = ub.oset(ub.argsort(_positions))
-            _keyorder |= (ub.oset(self._default) - _keyorder)
-        else:
-            _keyorder = list(self._default.keys())
-
         FUZZY_HYPHENS = getattr(self, '__fuzzy_hyphens__', 1)
 
-        # Need to clean this up, metadata probably isn't necessary.
-        for key, value in self._data.items():
-            if key in _metadata:
-                # Use the metadata in the Value class to enhance argparse
-                _value = _metadata[key]
-            else:
-                # _value = value if scfg_isinstance(value, Value) else None
-                if scfg_isinstance(value, Value):
-                    raise AssertionError('Did not expect {value=} to be a Value')
-                else:
-                    # In this case the user did not wrap the default with a
-                    # Value, so we can only infer so much about it, but we can
-                    # make some educated guesses.
-                    _autokw = {
-                        'help': '',
-                    }
-                    if isinstance(value, bool) or isinstance(value, int) and value in {0, 1}:
-                        # In this case they probably wanted a boolean flag
-                        # In any case it restrict functionality to set isflag=1
-                        _autokw['isflag'] = True
-                    _value = Value(value, **_autokw)
-
-            from scriptconfig import value as value_mod
+        for key, value, _value in self._argparse_plan():
             value_mod._value_add_argument_to_parser(
                 value, _value, self, parser, key, fuzzy_hyphens=FUZZY_HYPHENS)
 
         if special_options:
             special_group = parser.add_argument_group(
                 'scriptconfig options')
-            special_group.add_argument('--config', default=None, help=ub.codeblock(
-                '''
-                special scriptconfig option that accepts the path to a on-disk
-                configuration file, and loads that into this {!r} object.
-                ''').format(self.__class__.__name__))
-
-            special_group.add_argument('--dump', default=None, help=ub.codeblock(
-                '''
-                If specified, dump this config to disk.
-                ''').format(self.__class__.__name__))
-
+            special_group.add_argument(
+                '--config', default=None,
+                help=_SPECIAL_CONFIG_HELP.format(self.__class__.__name__))
+            special_group.add_argument(
+                '--dump', default=None, help=_SPECIAL_DUMP_HELP)
             special_group.add_argument(
                 '--dumps', action=argparse_ext.BooleanFlagOrKeyValAction,
-                help=ub.codeblock(
-                    '''
-                    If specified, dump this config stdout
-                    ''').format(self.__class__.__name__))
+                help=_SPECIAL_DUMPS_HELP)
 
         return parser
 
@@ -53,7 +53,6 @@ Example:
 Notes:
     https://docs.python.org/3/library/dataclasses.html
 """
-from collections import OrderedDict
 from scriptconfig.config import Config, MetaConfig
 from scriptconfig.value import Value
 import warnings
@@ -295,7 +294,7 @@ class DataConfig(Config, metaclass=MetaDataConfig):
         _dont_call_post_init = kwargs.pop('_dont_call_post_init', False)
 
         self._data = None
-        self._default = OrderedDict()
+        self._default = {}
         if getattr(self, '__default__', None):
             # allow for class attributes to specify the default
             self._default.update(self.__default__)
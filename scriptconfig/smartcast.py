@@ -2,6 +2,9 @@ __all__ = ['smartcast']
 
 NoneType = type(None)
 
+# Lowercase strings that disable an environment variable flag
+_FALSY = {'0', 'false', 'f', 'no', ''}
+
 
 def smartcast(item, astype=None, strict=False, allow_split=False):
     r"""
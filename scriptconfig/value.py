@@ -1,5 +1,6 @@
 from . import smartcast as smartcast_mod
 import re
+import textwrap
 import ubelt as ub
 
 
@@ -7,6 +8,22 @@ long_prefix_pat = re.compile('--[^-].*')
 short_prefix_pat = re.compile('-[^-].*')
 
 
+# Code template for long help strings in ported configs
+_PORTED_HELP_TEMPLATE = ub.codeblock(
+    """
+    ub.paragraph(
+        '''
+    {}
+        ''')
+    """)
+
+# Builtin types that never need to be copied
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Keyword arguments that are managed by the flag actions themselves
+_FLAG_IGNORED_KW = frozenset({'type', 'choices', 'action', 'nargs'})
+
+
 def normalize_option_str(s):
     return s.lstrip('-').replace('-', '_')
 
@@ -130,6 +147,31 @@ class Value(ub.NiceRepr):
         import copy
         return copy.copy(self)
 
+    def clone(self):
+        """
+        Copy this Value such that its ``value`` is independent of this one.
+
+        This is cheaper than a :func:`copy.deepcopy` because only the value is
+        deep copied (and only if it is mutable). The argparse metadata is
+        shared.
+
+        Returns:
+            Value
+
+        Example:
+            >>> from scriptconfig.value import *  # NOQA
+            >>> self = Value([1, 2], help='a list')
+            >>> other = self.clone()
+            >>> other.value.append(3)
+            >>> assert self.value == [1, 2]
+            >>> assert other.parsekw is self.parsekw
+        """
+        import copy
+        new = copy.copy(self)
+        if not isinstance(self.value, _IMMUTABLE_TYPES):
+            new.value = copy.deepcopy(self.value)
+        return new
+
     def _to_value_kw(self):
         """
         Used in port-to-dataconf and port-to-argparse
@@ -147,7 +189,7 @@ class Value(ub.NiceRepr):
             if isinstance(orig_type, str):
                 value_kw['type'] = repr(orig_type)
             else:
-                value_kw['type'] = CodeRepr(orig_type.__name__)
+                value_kw['type'] = _type_coderepr(orig_type)
 
         value_kw = ub.udict(value_kw)
         order = value_kw & ['value', 'nargs', 'type', 'isflag', 'position', 'required',
@@ -163,16 +205,8 @@ class Value(ub.NiceRepr):
             if value_kw['type'] == 'smartcast':
                 value_kw.pop('type')
             if orig_help and len(orig_help) > 40:
-                import textwrap
                 wrapped = ub.indent('\n'.join(textwrap.wrap(orig_help, width=60)), ' ' * 4)
-                block = ub.codeblock(
-                    """
-                    ub.paragraph(
-                        '''
-                    {}
-                        ''')
-                    """
-                ).format(wrapped)
+                block = _PORTED_HELP_TEMPLATE.format(wrapped)
                 value_kw['help'] = CodeRepr(ub.indent(block, ' ' * 8).lstrip())
                 # "ub.paragraph(\n'''\n{}\n''')".format(ub.indent(value.help, ' ' * 16))
         value_kw['default'] = value.value
@@ -180,7 +214,7 @@ class Value(ub.NiceRepr):
         return value_kw
 
     @classmethod
-    def _from_action(cls, action, actionid_to_groupkey, actionid_to_mgroupkey,
+    def _from_action(cls, action, action_to_groupkey, action_to_mgroupkey,
                      pos_counter):
         """
         Used in port_argparse
@@ -197,22 +231,25 @@ class Value(ub.NiceRepr):
         import argparse
         key = action.dest
 
-        long_option_strings = [
-            s for s in action.option_strings
-            if long_prefix_pat.match(s)
-        ]
-        short_option_strings = [
-            s for s in action.option_strings
-            if short_prefix_pat.match(s)
-        ]
-
-        alias = ub.oset(normalize_option_str(s)
-                        for s in long_option_strings)
-        alias = list(alias - {key})
-
-        short_alias = ub.oset(normalize_option_str(s)
-                              for s in short_option_strings)
-        short_alias = list(short_alias - {key})
+        # Split the option strings into long and short names in one pass.
+        # Equivalent to matching long_prefix_pat / short_prefix_pat.
+        long_names = []
+        short_names = []
+        for s in action.option_strings:
+            if s[:1] != '-' or len(s) < 2:
+                continue
+            if s[1] != '-':
+                short_names.append(normalize_option_str(s))
+            elif len(s) > 2 and s[2] != '-':
+                long_names.append(normalize_option_str(s))
+
+        # Ordered dedup that drops the name used as the key.
+        alias = dict.fromkeys(long_names)
+        alias.pop(key, None)
+        alias = list(alias)
+        short_alias = dict.fromkeys(short_names)
+        short_alias.pop(key, None)
+        short_alias = list(short_alias)
 
         real_value_kw = {
             'value': action.default,
@@ -232,11 +269,10 @@ class Value(ub.NiceRepr):
             real_value_kw.pop('isflag', None)
             if action.nargs is not None:
                 real_value_kw['nargs'] = action.nargs
-        action_id = id(action)
-        if action_id in actionid_to_groupkey:
-            real_value_kw['group'] = repr(actionid_to_groupkey[action_id])
-        if action_id in actionid_to_mgroupkey:
-            real_value_kw['mutex_group'] = repr(actionid_to_mgroupkey[action_id])
+        if action in action_to_groupkey:
+            real_value_kw['group'] = repr(action_to_groupkey[action])
+        if action in action_to_mgroupkey:
+            real_value_kw['mutex_group'] = repr(action_to_mgroupkey[action])
         if len(action.option_strings) == 0:
             real_value_kw['position'] = next(pos_counter)
         value = Value(**real_value_kw)
@@ -305,7 +341,7 @@ def _value_add_argument_to_parser(value, _value, self, parser, key, fuzzy_hyphen
     parser.
 
     Args:
-        value (Any): the unwrapped default value
+        value (Any): the unwrapped current value, used as the default
         _value (Value): the value metadata
     """
     # import argparse
@@ -330,7 +366,6 @@ def _value_add_argument_to_parser(value, _value, self, parser, key, fuzzy_hyphen
         # _value = _metadata[name]
         argkw.update(_value.parsekw)
         required = _value.required
-        value = _value.value
         isflag = _value.isflag
         positional = _value.position
 
@@ -365,12 +400,7 @@ def _value_add_argument_to_parser(value, _value, self, parser, key, fuzzy_hyphen
     if isflag:
         # Can we support both flag and setitem methods of cli
         # parsing?
-        argkw.pop('type', None)
-        argkw.pop('choices', None)
-        argkw.pop('action', None)
-        argkw.pop('nargs', None)
-        argkw['dest'] = name
-
+        argkw = {k: v for k, v in argkw.items() if k not in _FLAG_IGNORED_KW}
         if isflag == 'counter':
             argkw['action'] = argparse_ext.CounterOrKeyValAction
         else:
@@ -464,12 +494,7 @@ def _value_add_argument_kw(value, _value, self, key, fuzzy_hyphens=0):
     if isflag:
         # Can we support both flag and setitem methods of cli
         # parsing?
-        argkw.pop('type', None)
-        argkw.pop('choices', None)
-        argkw.pop('action', None)
-        argkw.pop('nargs', None)
-        argkw['dest'] = name
-
+        argkw = {k: v for k, v in argkw.items() if k not in _FLAG_IGNORED_KW}
         argkw['action'] = argparse_ext.BooleanFlagOrKeyValAction
 
     argkw['required'] = required
@@ -499,13 +524,12 @@ def _resolve_alias(name, _value, fuzzy_hyphens):
     if fuzzy_hyphens:
         # Do we want to allow for people to use hyphens on the CLI?
         # Maybe, we can make it optional.
-        unique_long_names = set(long_names)
-        modified_long_names = {n.replace('_', '-') for n in unique_long_names}
-        extra_long_names = modified_long_names - unique_long_names
-        long_names += sorted(extra_long_names)
-    short_option_strings = ['-' + n for n in short_names]
-    long_option_strings = ['--' + n for n in long_names]
-    option_strings = short_option_strings + long_option_strings
+        # Only names with underscores have a distinct hyphenated variant.
+        hyphenated = {n.replace('_', '-') for n in long_names if '_' in n}
+        if hyphenated:
+            long_names += sorted(hyphenated.difference(long_names))
+    option_strings = ['-' + n for n in short_names]
+    option_strings.extend(['--' + n for n in long_names])
     return option_strings
 
 
@@ -519,70 +543,124 @@ def scfg_isinstance(item, cls):
 
     Returns:
         bool
+
+    Example:
+        >>> from scriptconfig.value import *  # NOQA
+        >>> assert scfg_isinstance(Path(), Value)
+        >>> assert not scfg_isinstance(3, Value)
+        >>> # A reloaded class is recognized by its __scfg_class__
+        >>> class ReloadedValue:
+        >>>     __scfg_class__ = 'Value'
+        >>> assert scfg_isinstance(ReloadedValue(), Value)
     """
     # Note: it is safe to simply use isinstance(item, cls) when
-    # not reloading
-    if hasattr(item, '__scfg_class__')  and hasattr(cls, '__scfg_class__'):
-        return item.__scfg_class__ == cls.__scfg_class__
+    # not reloading, which is the common case.
+    if isinstance(item, cls):
+        return True
+    item_scfg_class = getattr(item, '__scfg_class__', None)
+    if item_scfg_class is None:
+        return False
+    return item_scfg_class == getattr(cls, '__scfg_class__', None)
+
+
+def _template_cast_func(template):
+    """
+    Determine how command line strings should be cast for a key.
+
+    Args:
+        template (Any): the class-level default for the key
+
+    Returns:
+        Callable: the template's cast method if it is a :class:`Value`,
+            otherwise :func:`scriptconfig.smartcast.smartcast`.
+    """
+    if isinstance(template, Value):
+        return template.cast
     else:
-        return isinstance(item, cls)
+        # smartcast non-valued params from commandline
+        return smartcast_mod.smartcast
 
 
 def _maker_smart_parse_action(self):
-    import argparse
-    from itertools import chain
-
-    scfg_object = self
-
-    ### TODO: be slightly less smart
-    class ParseAction(argparse._StoreAction):
-        def __init__(self, *args, **kwargs):
-            # required/= kwargs.pop('required', False)
-            super().__init__(*args, **kwargs)
-            # with script config nothing should be required by default
-            # (unless specified) all positional arguments should have
-            # keyword arg variants Setting required=False here will prevent
-            # positional args from erroring if they are not specified. I
-            # dont think there are other side effects, but we should make
-            # sure that is actually the case.
-            self.required = False  # hack
-
-            if self.type is None:
-                # If a type isn't explicitly declared, we will either use
-                # the template (if it exists) or try using a smartcast.
-                def _smart_type(value):
-                    key = self.dest
-                    template = scfg_object.default[key]
-                    if not isinstance(template, Value):
-                        # smartcast non-valued params from commandline
-                        value = smartcast_mod.smartcast(value)
-                    else:
-                        value = template.cast(value)
-                    return value
-
-                self.type = _smart_type
-
-        def __call__(action, parser, namespace, values, option_string=None):
-            # print('CALL action = {!r}'.format(action))
-            # print('option_string = {!r}'.format(option_string))
-            # print('values = {!r}'.format(values))
-
-            if isinstance(values, list) and len(values):
-                # We got a list of lists, which we hack into a flat list
-                if isinstance(values[0], list):
-                    values = list(chain(*values))
-
-            setattr(namespace, action.dest, values)
-            if not hasattr(parser, '_explicitly_given'):
-                # We might be given a subparser / parent parser
-                # and not the original one we created.
-                parser._explicitly_given = set()
-            parser._explicitly_given.add(action.dest)
-
-    return ParseAction
+    """
+    Get the argparse action class used for the arguments of a config.
+
+    The action class is bound to the defaults of the config class and cached
+    on it, so repeated parser construction reuses the same class.
+
+    Args:
+        self (scriptconfig.Config): the config instance
+
+    Returns:
+        Type[scriptconfig.argparse_ext.SmartCastAction]
+    """
+    from scriptconfig import argparse_ext
+    config_cls = self.__class__
+    default = getattr(config_cls, '__default__', None)
+    if default is None:
+        default = {}
+    action_cls = config_cls.__dict__.get('_scfg_parse_action', None)
+    if action_cls is None or action_cls._scfg_default is not default:
+        action_cls = type('ParseAction', (argparse_ext.SmartCastAction,), {
+            '_scfg_default': default,
+        })
+        config_cls._scfg_parse_action = action_cls
+    return action_cls
 
 
 class CodeRepr(str):
     # When we want to write out the exact code that should be inserted.
     def __repr__(self):
         return self
+
+
+class _FixmeCodeRepr(CodeRepr):
+    # Placeholder code for something that could not be ported. The ``fixme``
+    # note is written as a trailing comment on the line that uses it.
+    fixme = None
+
+
+def _fixme_comment(values):
+    """
+    The trailing comment for a line of ported code built from ``values``.
+
+    Example:
+        >>> _fixme_comment([CodeRepr('int'), 3])
+        ''
+    """
+    notes = [v.fixme for v in values if isinstance(v, _FixmeCodeRepr)]
+    if notes:
+        return '  # FIXME: ' + '; '.join(notes)
+    return ''
+
+
+def _type_coderepr(type_):
+    """
+    The code used to reference a type in ported code.
+
+    Callables like :func:`functools.partial` objects or lambdas do not have a
+    name we can reference, so a ``None`` placeholder with a FIXME note is used
+    instead and a warning is emitted.
+
+    Example:
+        >>> import functools
+        >>> import warnings
+        >>> _type_coderepr(int)
+        int
+        >>> with warnings.catch_warnings(record=True):
+        >>>     warnings.simplefilter('always')
+        >>>     code = _type_coderepr(functools.partial(int, base=16))
+        >>> code
+        None
+        >>> print(code.fixme)
+        could not port type=functools.partial(<class 'int'>, base=16)
+    """
+    name = getattr(type_, '__name__', None)
+    if isinstance(name, str) and name.isidentifier():
+        return CodeRepr(name)
+    import warnings
+    orig = ' '.join(repr(type_).split())
+    warnings.warn(f'Unable to port type={orig}. Using type=None instead')
+    code = _FixmeCodeRepr('None')
+    code.fixme = f'could not port type={orig}'
+    return code
@@ -56,6 +56,9 @@ class Value(ub.NiceRepr):
     def copy(self):
         ...
 
+    def clone(self) -> Value:
+        ...
+
 
 class Flag(Value):
 
@@ -105,3 +105,35 @@ def port_argparse_from_scriptconfig_with_unwrapped_values():
         """).replace('$', '')
     print(want)
     assert argparse_text == want
+
+
+def test_port_argparse_with_nameless_type():
+    """
+    Types without a __name__ (e.g. partials) should not break porting. They
+    are replaced with a placeholder and the generated code must still compile.
+    """
+    import functools
+    import pytest
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--hexval', type=functools.partial(int, base=16))
+    with pytest.warns(UserWarning, match='Unable to port type'):
+        text = scfg.Config.port_argparse(parser)
+    compile(text, '<ported>', 'exec')
+    assert 'hexval = scfg.Value(None, type=None, ' in text
+    assert '  # FIXME: could not port type=functools.partial(' in text
+
+    with pytest.warns(UserWarning, match='Unable to port type'):
+        text = scfg.Config.port_argparse(parser, style='orig')
+    compile(text, '<ported>', 'exec')
+    assert "'hexval': scfg.Value(None, type=None, " in text
+    assert '  # FIXME: could not port type=functools.partial(' in text
+
+    class MyConfig(scfg.DataConfig):
+        hexval = scfg.Value(None, type=functools.partial(int, base=16))
+        lamval = scfg.Value(None, type=lambda x: x)
+    with pytest.warns(UserWarning, match='Unable to port type'):
+        argparse_text = MyConfig().port_to_argparse()
+    compile(argparse_text, '<ported>', 'exec')
+    assert 'type=None, ' in argparse_text
+    assert ')  # FIXME: could not port type=functools.partial(' in argparse_text
+    assert ')  # FIXME: could not port type=<function' in argparse_text
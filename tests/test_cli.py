@@ -66,3 +66,30 @@ def _test_common_cli_classmethod(ConfigCls):
 
     config = ConfigCls.cli(data={'x': 4}, argv=['--x=5'])
     assert config['x'] == 5
+
+
+def test_duplicate_positions_are_rejected():
+    """
+    Two positional arguments cannot share a position, whether the positions
+    come from the class or from instance defaults.
+    """
+    import pytest
+    import scriptconfig as scfg
+
+    class BadConfig(scfg.Config):
+        __default__ = {
+            'a': scfg.Value(1, position=1),
+            'b': scfg.Value(2, position=1),
+        }
+    with pytest.raises(Exception, match='same position'):
+        BadConfig.cli(argv=[])
+
+    class GoodConfig(scfg.Config):
+        __default__ = {
+            'a': scfg.Value(1, position=1),
+            'b': scfg.Value(2, position=2),
+        }
+    assert GoodConfig.cli(argv=['3', '4']).to_dict() == {'a': 3, 'b': 4}
+    config = GoodConfig(default={'b': scfg.Value(2, position=1)})
+    with pytest.raises(Exception, match='same position'):
+        config.argparse()
@@ -14,3 +14,47 @@ def test_cast_set():
     config = DemoConfig()
     keys = set(config)
     assert keys == set(config.keys())
+
+
+class UpperSetConfig(scfg.Config):
+    __default__ = {
+        'x': 1,
+        'y': 'a',
+    }
+
+    def setitem(self, key, value):
+        if key == 'y':
+            value = value.upper()
+        super().setitem(key, value)
+
+
+class UpperGetConfig(scfg.Config):
+    __default__ = {
+        'x': 1,
+        'y': 'a',
+    }
+
+    def getitem(self, key):
+        value = super().getitem(key)
+        if key == 'y':
+            value = value.upper()
+        return value
+
+
+def test_overridden_setitem_used_by_load():
+    config = UpperSetConfig(data={'y': 'foo'})
+    assert config['y'] == 'FOO'
+
+
+def test_overridden_setitem_used_by_cmdline():
+    config = UpperSetConfig(cmdline=['--y=bar'])
+    assert config['y'] == 'BAR'
+    config = UpperSetConfig(data={'x': 2}, cmdline=['--y=bar'])
+    assert config['y'] == 'BAR'
+
+
+def test_overridden_getitem_used_by_dumps():
+    import json
+    config = UpperGetConfig()
+    assert config.to_dict()['y'] == 'A'
+    assert json.loads(config.dumps(mode='json'))['y'] == 'A'
@@ -0,0 +1,182 @@
+def test_json_and_yaml_file_roundtrip():
+    """
+    Configs dumped to json or yaml should load back to the same values.
+    """
+    import ubelt as ub
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 1
+        name = 'foo'
+        items = [1, 2, 3]
+
+    dpath = ub.Path.appdir('scriptconfig', 'tests', 'file_io').ensuredir()
+    config = MyConfig(num=2, name='bar', items=[4, 5])
+
+    json_fpath = dpath / 'config.json'
+    json_fpath.write_text(config.dumps(mode='json'))
+    recon = MyConfig().load(str(json_fpath))
+    assert recon.to_dict() == config.to_dict()
+
+    yaml_fpath = dpath / 'config.yaml'
+    yaml_fpath.write_text(config.dumps(mode='yaml'))
+    recon = MyConfig().load(str(yaml_fpath))
+    assert recon.to_dict() == config.to_dict()
+
+    # Explicit modes work with open files as well
+    with open(json_fpath, 'r') as file:
+        recon = MyConfig().load(file, mode='json')
+    assert recon.to_dict() == config.to_dict()
+
+
+def test_yaml_file_with_json_content():
+    """
+    Json is valid yaml, so it should load from files with a yaml extension.
+    """
+    import ubelt as ub
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 1
+        items = None
+
+    dpath = ub.Path.appdir('scriptconfig', 'tests', 'file_io').ensuredir()
+    fpath = dpath / 'json_content.yaml'
+    fpath.write_text('\n  {"num": 3, "items": [1, "a"]}')
+    config = MyConfig().load(str(fpath))
+    assert config.to_dict() == {'num': 3, 'items': [1, 'a']}
+
+    # Flow style yaml that is not json falls back to the yaml parser
+    fpath.write_text('{num: 4, items: [b]}')
+    config = MyConfig().load(str(fpath))
+    assert config.to_dict() == {'num': 4, 'items': ['b']}
+
+
+def test_load_from_file_object_without_mode():
+    """
+    Open files have no extension to infer the mode from, so their content
+    determines the parser.
+    """
+    import io
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 1
+        name = None
+
+    file = io.StringIO('{"num": 2, "name": "1e3"}')
+    config = MyConfig().load(file)
+    assert config.to_dict() == {'num': 2, 'name': '1e3'}
+
+    # Unquoted, yaml reads this as a string, not as a float
+    file = io.StringIO('{"num": 2, "name": 1e3}')
+    config = MyConfig().load(file)
+    assert config.to_dict() == {'num': 2, 'name': '1e3'}
+
+    file = io.StringIO('num: 3\nname: foo\n')
+    config = MyConfig().load(file)
+    assert config.to_dict() == {'num': 3, 'name': 'foo'}
+
+
+def test_dump_to_stream():
+    """
+    Both dump modes should write to a given stream.
+    """
+    import io
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 1
+        name = 'foo'
+
+    config = MyConfig()
+    for mode in ['json', 'yaml']:
+        stream = io.StringIO()
+        assert config.dump(stream, mode=mode) is None
+        assert stream.getvalue() == config.dumps(mode=mode)
+        stream.seek(0)
+        recon = MyConfig().load(stream, mode=mode)
+        assert recon.to_dict() == config.to_dict()
+
+
+def test_load_non_ascii_file():
+    """
+    Config files are read as utf-8 regardless of the locale.
+    """
+    import ubelt as ub
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        name = None
+
+    dpath = ub.Path.appdir('scriptconfig', 'tests', 'file_io').ensuredir()
+    for fname, text in [('unicode.yaml', 'name: café\n'),
+                        ('unicode.json', '{"name": "café"}')]:
+        fpath = dpath / fname
+        fpath.write_bytes(text.encode('utf-8'))
+        config = MyConfig().load(str(fpath))
+        assert config['name'] == 'café'
+
+
+def test_load_from_pathlike():
+    """
+    Path objects are accepted wherever a string path is.
+    """
+    import ubelt as ub
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 1
+
+    dpath = ub.Path.appdir('scriptconfig', 'tests', 'file_io').ensuredir()
+    fpath = dpath / 'pathlike.JSON'
+    fpath.write_text('{"num": 5}')
+    config = MyConfig().load(fpath)
+    assert config['num'] == 5
+    config = MyConfig.cli(argv=['--config', str(fpath)])
+    assert config['num'] == 5
+
+
+def test_json_shaped_yaml_matches_yaml_parser():
+    """
+    Json content in a yaml file must load the same values the yaml parser
+    would give, even for literals that json and YAML 1.1 disagree on.
+    """
+    import io
+    import yaml
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        x = None
+        y = None
+
+    texts = [
+        '{"x": 1e3, "y": NaN}',
+        '{"x": 1.5e3, "y": -Infinity}',
+        '{"x": 1.5e+3, "y": 2.5}',
+        '{"x": [1E-2, 0.5], "y": {"z": Infinity}}',
+    ]
+    for text in texts:
+        expected = yaml.safe_load(text)
+        config = MyConfig().load(io.StringIO(text))
+        assert config.to_dict() == expected, text
+        config = MyConfig().load(io.StringIO(text), mode='yaml')
+        assert config.to_dict() == expected, text
+    config = MyConfig().load(io.StringIO(texts[0]))
+    assert config.to_dict() == {'x': '1e3', 'y': 'NaN'}
+
+
+def test_parse_without_bytes_warnings():
+    """
+    Detecting json content must not compare str with bytes, which is an error
+    under ``python -bb``.
+    """
+    import subprocess
+    import sys
+    code = (
+        'from scriptconfig.config import _parse_config_text\n'
+        'assert _parse_config_text(b"[1, 2]") == [1, 2]\n'
+        'assert _parse_config_text("{\\"a\\": 1}") == {"a": 1}\n'
+        'assert _parse_config_text(b"a: 1") == {"a": 1}\n'
+    )
+    subprocess.run([sys.executable, '-bb', '-c', code], check=True)
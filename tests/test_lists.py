@@ -90,3 +90,23 @@ def test_list_parsing():
         '--item4=spam,eggs',
     ])
     print('loaded = ' + ub.urepr(config.asdict(), nl=1))
+
+
+def test_empty_nargs_positional_with_scalar_default():
+    """
+    An empty nargs='*' positional is given its raw default by argparse, which
+    does not have to be a list.
+    """
+    import scriptconfig as scfg
+
+    class ExampleConfig(scfg.Config):
+        __default__ = {
+            'src': scfg.Value(5, position=1, nargs='*'),
+        }
+
+    config = ExampleConfig(cmdline=[])
+    assert config.to_dict() == {'src': 5}
+    config = ExampleConfig(cmdline=['a', 'b'])
+    assert config.to_dict() == {'src': ['a', 'b']}
+    config = ExampleConfig(cmdline=['a,b', 'c,d'])
+    assert config.to_dict() == {'src': ['a', 'b', 'c', 'd']}
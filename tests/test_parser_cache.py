@@ -0,0 +1,48 @@
+def test_cached_parser_reused_across_instances():
+    """
+    The parser cached on a class is reused by later instances, but each
+    instance parses with its own values as the defaults.
+    """
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        a = 10
+        b = 'foo'
+        c = None
+
+    parser = MyConfig()._cached_argparse(special_options=True)
+    config1 = MyConfig.cli(data={'a': 11, 'b': 'x'}, argv=['--c=1'])
+    config2 = MyConfig.cli(data={'a': 12}, argv=[])
+    config3 = MyConfig.cli(argv=['--b=y'])
+    assert MyConfig()._cached_argparse(special_options=True) is parser
+    assert config1.to_dict() == {'a': 11, 'b': 'x', 'c': 1}
+    assert config2.to_dict() == {'a': 12, 'b': 'foo', 'c': None}
+    assert config3.to_dict() == {'a': 10, 'b': 'y', 'c': None}
+
+
+def test_cached_parser_is_thread_safe():
+    """
+    Concurrent cli calls on the same class must not see each other's values.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        a = 1
+        b = 'foo'
+        c = None
+
+    def worker(i):
+        wrong = []
+        for _ in range(100):
+            config = MyConfig.cli(data={'a': i + 10, 'b': f'v{i}'},
+                                  argv=[f'--c={i}'])
+            expected = {'a': i + 10, 'b': f'v{i}', 'c': i}
+            if config.to_dict() != expected:
+                wrong.append(config.to_dict())
+        return wrong
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(worker, range(8)))
+    wrong = [r for rs in results for r in rs]
+    assert not wrong, wrong
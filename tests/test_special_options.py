@@ -20,3 +20,26 @@ def test_without_special_options():
     # But setting special_options=False will allow for this
     config = MyConfig.cli(argv=['--config=foo'], special_options=False)
     assert config.config == 'foo'
+
+
+def test_config_file_with_cli_overrides():
+    """
+    Values explicitly given on the command line take precedence over values
+    loaded with the special --config option.
+    """
+    import ubelt as ub
+    import scriptconfig as scfg
+
+    class MyConfig(scfg.DataConfig):
+        num = 10
+        name = 'a'
+
+    dpath = ub.Path.appdir('scriptconfig', 'tests', 'special_options').ensuredir()
+    fpath = dpath / 'config.yaml'
+    fpath.write_text('num: 3\nname: b\n')
+
+    config = MyConfig.cli(argv=['--config', str(fpath)])
+    assert config.to_dict() == {'num': 3, 'name': 'b'}
+
+    config = MyConfig.cli(argv=['--config', str(fpath), '--name=z'])
+    assert config.to_dict() == {'num': 3, 'name': 'z'}